@@ -14,15 +14,45 @@
 from pathlib import Path
 import glob
 import os
+import re
 from typing import List, Optional, Union
 from warnings import warn
 import sys
 import json
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 import numpy as np
 from PIL import Image
 
+import torch
 from torch.utils.data import Dataset
+from torchvision.transforms import ToTensor
+
+try:
+    import pyvips
+except (ImportError, OSError):
+    # OSError: the pyvips wheel is installed but libvips itself is not
+    pyvips = None
+
+try:
+    from nvidia import dali
+    from nvidia.dali import fn as dali_fn
+    from nvidia.dali import types as dali_types
+except ImportError:
+    dali = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB
+except ImportError:
+    TurboJPEG = None
+
 
 from avalanche.benchmarks.datasets import default_dataset_location
 from avalanche.benchmarks.datasets.endless_cl_sim import endless_cl_sim_data
@@ -31,8 +61,52 @@ from avalanche.benchmarks.datasets.downloadable_dataset import (
 )
 
 
+def _natural_sort_key(name):
+    """Sort key splitting a name into text and integer chunks, so that
+    frame indices order numerically regardless of zero-padding."""
+    return [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", name)]
+
+
+def _load_json(path):
+    """Parses a json file, with orjson when available."""
+    with open(path, "rb") as file:
+        if orjson is not None:
+            return orjson.loads(file.read())
+        return json.loads(file.read())
+
+
+def _lut_from_maps(classmap, labelmap):
+    """Builds the 256-entry label->class lookup table for the given
+    classmap/labelmap mappings."""
+    lut = np.zeros(256, dtype=np.uint8)
+    for label_name, (min_val, max_val) in labelmap.items():
+        lut[min_val : max_val + 1] = classmap[label_name]
+    lut.setflags(write=False)
+    return lut
+
+
+@lru_cache(maxsize=None)
+def _build_lut(segmentation_file, classmap_file, mtime):
+    """Builds the 256-entry label->class lookup table for the given
+    metadata files.
+
+    Cached so that all subsequences created from the same files share a
+    single read-only table instead of each rebuilding its own; `mtime`
+    ties the cache entry to the segmentation file contents.
+    """
+    return _lut_from_maps(
+        VideoSubSequence._load_classmap(classmap_file),
+        VideoSubSequence._load_labelmap(segmentation_file),
+    )
+
+
 class ClassificationSubSequence(Dataset):
-    """Image-Patch Classification Subsequence Dataset"""
+    """Image-Patch Classification Subsequence Dataset
+
+    For additional image decoding and resizing throughput, `pillow-simd
+    <https://github.com/uploadcare/pillow-simd>`__ can be installed as a
+    drop-in replacement for Pillow, providing SSE4/AVX2 resample loops.
+    """
 
     def __init__(
         self,
@@ -68,14 +142,57 @@ class ClassificationSubSequence(Dataset):
 
         self.labelmap = self._load_labelmap(labelmap_path)
 
+        # Optional turbojpeg backend: decodes JPEG files directly into a
+        # numpy array at a power-of-2 scale with a single C call
+        self._turbo_jpeg = None
+        if TurboJPEG is not None:
+            try:
+                self._turbo_jpeg = TurboJPEG()
+            except (OSError, RuntimeError):
+                # libturbojpeg shared library is not available
+                self._turbo_jpeg = None
+
         return
 
+    def _turbojpeg_loader(self, file_path):
+        """Decodes a JPEG with turbojpeg at the largest power-of-2
+        downscale that still covers the patch size, then finishes with a
+        single resize to the exact patch size if needed.
+        """
+        with open(file_path, "rb") as f:
+            buf = f.read()
+        width, height = self._turbo_jpeg.decode_header(buf)[:2]
+        denominator = 1
+        while (
+            denominator < 8
+            and width // (denominator * 2) >= self.patch_size
+            and height // (denominator * 2) >= self.patch_size
+        ):
+            denominator *= 2
+        img = Image.fromarray(
+            self._turbo_jpeg.decode(
+                buf, pixel_format=TJPF_RGB, scaling_factor=(1, denominator)
+            )
+        )
+        if img.size != (self.patch_size, self.patch_size):
+            img = img.resize((self.patch_size, self.patch_size), Image.BILINEAR)
+        return img
+
     def _pil_loader(self, file_path):
+        if self._turbo_jpeg is not None and file_path.lower().endswith(
+            (".jpg", ".jpeg")
+        ):
+            return self._turbojpeg_loader(file_path)
+
         with open(file_path, "rb") as f:
-            img = (
-                Image.open(f)
-                .convert("RGB")
-                .resize((self.patch_size, self.patch_size), Image.NEAREST)
+            img = Image.open(f)
+            # For JPEG sources this lets libjpeg downscale in the DCT
+            # domain (1/2, 1/4 or 1/8 of the native size) during decode,
+            # instead of decoding at full resolution just to throw away
+            # nearly all pixels in the resize below.
+            img.draft("RGB", (self.patch_size * 2, self.patch_size * 2))
+            img = img.convert("RGB").resize(
+                (self.patch_size, self.patch_size), Image.BILINEAR
             )
         return img
 
@@ -86,10 +203,9 @@ class ClassificationSubSequence(Dataset):
 
         # If path is valid, load labelmap from json file
         elif Path(path).exists():
-            with open(path) as file:
-                json_array = json.load(file)
-                labelmap = json_array["SegmentationClasses"]
-                return labelmap
+            json_array = _load_json(path)
+            labelmap = json_array["SegmentationClasses"]
+            return labelmap
 
         # Finally, raise value error
         raise ValueError(f"path: {path} does not exist!")
@@ -102,7 +218,20 @@ class ClassificationSubSequence(Dataset):
         target = self._convert_target(self.targets[index])
 
         img = self._pil_loader(img_path)
-        img = self.transform(img)
+        if isinstance(self.transform, ToTensor):
+            # Fast path: build the float tensor straight from the PIL
+            # image with a fused permute/scale chain. np.array makes a
+            # single writable uint8 copy, so from_numpy does not warn
+            # about wrapping the read-only PIL buffer
+            img = (
+                torch.from_numpy(np.array(img))
+                .permute(2, 0, 1)
+                .contiguous()
+                .float()
+                .div_(255)
+            )
+        else:
+            img = self.transform(img)
 
         if self.target_transform is not None:
             target = self.target_transform(target)
@@ -113,6 +242,132 @@ class ClassificationSubSequence(Dataset):
         return len(self.file_paths)
 
 
+class CachedSubSequence(Dataset):
+    """Caching wrapper for a :class:`ClassificationSubSequence`.
+
+    With fixed-size image-patches, decoding and transforming a sample
+    yields the same tensor on every epoch. The first access to each index
+    therefore stores the transformed sample into a single disk-backed
+    `np.memmap` arena, which is shared across DataLoader worker processes
+    through the page cache. Later accesses return the cached data
+    directly, skipping JPEG decode, resize and transform entirely.
+    """
+
+    def __init__(self, dataset: ClassificationSubSequence, cache_path=None):
+        """Creates a cache around the given subsequence dataset.
+
+        :param dataset: The `ClassificationSubSequence` to be wrapped.
+        :param cache_path: Path the cache arena file is written to.
+            Defaults to None, which places the cache file in the system's
+            temporary directory.
+        """
+        self.dataset = dataset
+
+        # Probe the first sample to size the arena
+        first_sample, _ = dataset[0]
+        first_sample = np.asarray(first_sample)
+
+        if cache_path is None:
+            cache_path = os.path.join(
+                tempfile.gettempdir(),
+                f"endless_cl_sim_cache_{os.getpid()}_{id(dataset)}.bin",
+            )
+        self.cache_path = cache_path
+
+        self._cache = np.memmap(
+            cache_path,
+            dtype=first_sample.dtype,
+            mode="w+",
+            shape=(len(dataset),) + first_sample.shape,
+        )
+        # Bitmap of already populated entries, in the same arena style
+        self._populated = np.memmap(
+            cache_path + ".mask",
+            dtype=np.uint8,
+            mode="w+",
+            shape=(len(dataset),),
+        )
+        return
+
+    def _get_target(self, index):
+        target = self.dataset._convert_target(self.dataset.targets[index])
+        if self.dataset.target_transform is not None:
+            target = self.dataset.target_transform(target)
+        return target
+
+    def __getitem__(self, index: int):
+        if self._populated[index]:
+            img = torch.from_numpy(np.asarray(self._cache[index]))
+            return img, self._get_target(index)
+
+        img, target = self.dataset[index]
+        self._cache[index] = np.asarray(img)
+        self._populated[index] = 1
+        return img, target
+
+    def __len__(self) -> int:
+        return len(self.dataset)
+
+
+class PrefetchingSubSequence(Dataset):
+    """Read-ahead wrapper for a subsequence dataset.
+
+    Loading a sample is I/O bound (a blocking file read followed by the
+    decode), so a small thread pool can overlap the reads of upcoming
+    indices with the decode of the current one. This complements
+    `num_workers`: the pool lives inside each DataLoader worker process
+    and hides disk latency within it. Accesses are assumed to be roughly
+    sequential (the usual sampler order); indices that have not been
+    prefetched fall back to a direct load.
+    """
+
+    def __init__(self, dataset, num_threads=2, lookahead=8):
+        """Creates a prefetching wrapper around the given dataset.
+
+        :param dataset: The subsequence dataset to be wrapped.
+        :param num_threads: Number of reader threads. Defaults to 2.
+        :param lookahead: Number of samples scheduled ahead of the last
+            requested index. Defaults to 8.
+        """
+        self.dataset = dataset
+        self.num_threads = num_threads
+        self.lookahead = lookahead
+        # Created lazily on first access, so that every DataLoader
+        # worker process spawns its own pool
+        self._executor = None
+        self._owner_pid = None
+        self._futures = {}
+        return
+
+    def _schedule_ahead(self, index):
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.num_threads)
+            self._owner_pid = os.getpid()
+        # Drop stale entries so the future map stays bounded
+        for i in [i for i in self._futures if i <= index]:
+            del self._futures[i]
+        for i in range(index + 1, min(index + 1 + self.lookahead, len(self.dataset))):
+            if i not in self._futures:
+                self._futures[i] = self._executor.submit(self.dataset.__getitem__, i)
+
+    def __getitem__(self, index: int):
+        if self._owner_pid is not None and self._owner_pid != os.getpid():
+            # A pool inherited through fork has no live worker threads in
+            # this process and its pending futures can never complete;
+            # discard both so a fresh pool is created below
+            self._executor = None
+            self._owner_pid = None
+            self._futures = {}
+        future = self._futures.pop(index, None)
+        self._schedule_ahead(index)
+        if future is not None:
+            return future.result()
+        return self.dataset[index]
+
+    def __len__(self) -> int:
+        return len(self.dataset)
+
+
 class VideoSubSequence(Dataset):
     """Video Subsequence Dataset"""
 
@@ -125,6 +380,9 @@ class VideoSubSequence(Dataset):
         patch_size=(240, 135),
         transform=None,
         target_transform=None,
+        classmap=None,
+        labelmap=None,
+        return_raw=False,
     ):
         """Dataset that contains the (image) data and semantic segmentation
         targets for one subsequence of a video sequence.
@@ -147,6 +405,17 @@ class VideoSubSequence(Dataset):
             data.
         :param target_transform: Eventual transformations to be applied to the
             target data.
+        :param classmap: Optional already parsed classmap dictionary. When
+            provided, `classmap_file` is not read. Defaults to None.
+        :param labelmap: Optional already parsed labelmap dictionary. When
+            provided, `segmentation_file` is not read. Defaults to None.
+        :param return_raw: When set, `__getitem__` skips `transform` and
+            returns the image as a raw `uint8` HWC tensor together with
+            the converted `uint8` target array. This allows running the
+            transforms once per batch on the GPU (e.g. with
+            `torchvision.transforms.v2` after a `pin_memory` transfer)
+            instead of once per sample in the DataLoader workers.
+            Defaults to False.
         """
         self.file_paths = file_paths
         self.targets = target_paths
@@ -154,80 +423,179 @@ class VideoSubSequence(Dataset):
         self.classmap_file = classmap_file
         self.patch_size = patch_size
         self.transform = transform
-        self.target_transform = transform
+        self.target_transform = target_transform
+        self.return_raw = return_raw
 
         # Init classmap
-        self.classmap = self._load_classmap(classmap_file=self.classmap_file)
+        if classmap is None:
+            classmap = self._load_classmap(classmap_file=self.classmap_file)
+        self.classmap = classmap
 
         # Init labelmap
-        self.labelmap = self._load_labelmap(labelmap_file=self.segmentation_file)
+        if labelmap is None:
+            labelmap = self._load_labelmap(labelmap_file=self.segmentation_file)
+        self.labelmap = labelmap
+
+        # Init sorted interval arrays for `_get_label_name`
+        names = sorted(self.labelmap, key=lambda name: self.labelmap[name][0])
+        self._label_names = names
+        self._label_mins = np.array(
+            [self.labelmap[name][0] for name in names], dtype=np.int32
+        )
+        self._label_maxs = np.array(
+            [self.labelmap[name][1] for name in names], dtype=np.int32
+        )
+
+        # Init label->class lookup table. With injected mappings the
+        # table is built from them directly (the metadata files are not
+        # read and may not even exist); in the pure-file path all
+        # subsequences built from the same files share one cached table
+        if classmap is not None or labelmap is not None:
+            self._lut = _lut_from_maps(self.classmap, self.labelmap)
+        else:
+            self._lut = _build_lut(
+                self.segmentation_file,
+                self.classmap_file,
+                os.path.getmtime(self.segmentation_file),
+            )
         return
 
     def _pil_loader(self, file_path, is_target=False):
+        """Loads an image (or target) file.
+
+        Images are returned as PIL images, targets as `np.uint8` arrays.
+        When `pyvips` is installed, targets are decoded with libvips
+        sequential access straight into a numpy buffer, skipping the
+        intermediate PIL image and its extra copy.
+        """
+        if is_target:
+            if pyvips is not None:
+                return self._vips_target_loader(file_path)
+            with open(file_path, "rb") as f:
+                img = (
+                    Image.open(f)
+                    .convert("L")
+                    .resize((self.patch_size[0], self.patch_size[1]), Image.NEAREST)
+                )
+            return np.asarray(img)
+
         with open(file_path, "rb") as f:
-            convert_identifier = "RGB"
-            if is_target:
-                convert_identifier = "L"
             img = (
                 Image.open(f)
-                .convert(convert_identifier)
+                .convert("RGB")
                 .resize((self.patch_size[0], self.patch_size[1]), Image.NEAREST)
             )
         return img
 
-    def _load_classmap(self, classmap_file):
+    def _vips_target_loader(self, file_path):
+        image = pyvips.Image.new_from_file(file_path, access="sequential")
+        if image.bands > 1:
+            image = image.colourspace("b-w")
+        # Nearest-neighbour kernel: label values must not be interpolated
+        image = image.resize(
+            self.patch_size[0] / image.width,
+            vscale=self.patch_size[1] / image.height,
+            kernel="nearest",
+        )
+        buf = image.write_to_memory()
+        return np.frombuffer(buf, dtype=np.uint8).reshape(image.height, image.width)
+
+    @staticmethod
+    def _load_classmap(classmap_file):
         classmap = {}
         if classmap_file is None:
             classmap = endless_cl_sim_data.default_semseg_classmap_obj
         elif Path(classmap_file).exists():
-            with open(classmap_file) as file:
-                json_array = json.load(file)
-                classmap = json_array["ClassMapping"]
+            json_array = _load_json(classmap_file)
+            classmap = json_array["ClassMapping"]
         else:
             raise ValueError(f"classmap_file: {classmap_file} does not exist!")
         return classmap
 
-    def _load_labelmap(self, labelmap_file):
+    @staticmethod
+    def _load_labelmap(labelmap_file):
         labelmap = {}
         if Path(labelmap_file).exists():
-            with open(labelmap_file) as file:
-                json_array = json.load(file)
+            json_array = _load_json(labelmap_file)
 
-                segMin = json_array[0]["ObjectClassMapping"]
-                segMax = json_array[1]["ObjectClassMapping"]
+            segMin = json_array[0]["ObjectClassMapping"]
+            segMax = json_array[1]["ObjectClassMapping"]
 
-                for key in segMin:
-                    labelmap[key] = [segMin[key], segMax[key]]
+            for key in segMin:
+                labelmap[key] = [segMin[key], segMax[key]]
         else:
             raise ValueError(f"labelmap_file: {labelmap_file} does not exist!")
         return labelmap
 
     def _get_label_name(self, label):
-        for key in self.labelmap:
-            min_val, max_val = self.labelmap[key]
-            if min_val == max_val:
-                if label == min_val:
-                    return key
-            else:
-                if label >= min_val and label <= max_val:
-                    return key
+        # Binary search on the sorted interval lower bounds, then a single
+        # upper bound check, instead of scanning the labelmap linearly
+        index = int(np.searchsorted(self._label_mins, label, side="right")) - 1
+        if index >= 0 and label <= self._label_maxs[index]:
+            return self._label_names[index]
         raise ValueError(f"label: {label} could not be converted!")
 
     def _convert_target(self, target):
         """Converts segmentation target (instance-segmented) according to
         classmap.
         """
-        # Get all unique labels in target
-        target = target.copy()
-        unique_labels = torch.unique(torch.tensor(target)).numpy()
-
-        for unique_label in unique_labels:
-            # Get respective obj class label
-            label_name = self._get_label_name(unique_label)
-            class_label = self.classmap[label_name]
-            # Convert instance label to object class label
-            target[target == unique_label] = class_label
-        return target
+        # The gather allocates the output itself; `target` is only read,
+        # so no defensive copy is needed
+        return self._lut[target]
+
+    def dali_pipeline(self, batch_size=1, num_threads=2, device_id=0):
+        """Builds an NVIDIA DALI pipeline for this subsequence.
+
+        The pipeline decodes images and segmentation targets, resizes
+        them to `patch_size` and applies the label->class lookup table,
+        all on the GPU, removing the per-sample Python decode path from
+        the DataLoader worker processes.
+
+        :param batch_size: Batch size of the pipeline. Defaults to 1.
+        :param num_threads: Number of CPU threads used by the pipeline.
+            Defaults to 2.
+        :param device_id: Id of the GPU to run the pipeline on.
+            Defaults to 0.
+        :return: a `nvidia.dali.pipeline.Pipeline` producing
+            (image, target) batches.
+        """
+        if dali is None:
+            raise ModuleNotFoundError(
+                "nvidia-dali is not installed. Please install it "
+                "following the instructions at "
+                "https://docs.nvidia.com/deeplearning/dali/ to use the "
+                "DALI backend."
+            )
+
+        pipeline = dali.pipeline.Pipeline(
+            batch_size=batch_size, num_threads=num_threads, device_id=device_id
+        )
+        with pipeline:
+            images, _ = dali_fn.readers.file(files=self.file_paths, name="images")
+            targets, _ = dali_fn.readers.file(files=self.targets, name="targets")
+            images = dali_fn.decoders.image(images, device="mixed")
+            targets = dali_fn.decoders.image(
+                targets, device="mixed", output_type=dali_types.GRAY
+            )
+            images = dali_fn.resize(
+                images,
+                resize_x=self.patch_size[0],
+                resize_y=self.patch_size[1],
+            )
+            targets = dali_fn.resize(
+                targets,
+                resize_x=self.patch_size[0],
+                resize_y=self.patch_size[1],
+                interp_type=dali_types.INTERP_NN,
+            )
+            # GPU equivalent of `_convert_target`
+            targets = dali_fn.lookup_table(
+                targets,
+                keys=list(range(256)),
+                values=[int(value) for value in self._lut],
+            )
+            pipeline.set_outputs(images, targets)
+        return pipeline
 
     def __getitem__(self, index: int):
         img_path = self.file_paths[index]
@@ -235,11 +603,21 @@ class VideoSubSequence(Dataset):
 
         # Load image
         img = self._pil_loader(img_path, is_target=False)
-        img = self.transform(img)
 
         # Load target
         target = self._pil_loader(target_path, is_target=True)
-        target = self._convert_target(np.asarray(target))
+        target = self._convert_target(target)
+
+        if self.return_raw:
+            # Raw uint8 HWC tensor, no per-sample float math; the
+            # trainer applies the transforms batch-wise instead.
+            # np.array copies into a writable, contiguous buffer
+            return torch.from_numpy(np.array(img)), target
+
+        img = self.transform(img)
+
+        if self.target_transform is not None:
+            target = self.target_transform(target)
 
         return img, target
 
@@ -260,6 +638,7 @@ class EndlessCLSimDataset(DownloadableDataset):
         target_transform=None,
         download=True,
         semseg=False,
+        use_dali=False,
         labelmap_path=None,
     ):
         """Creates an instance of the Endless-Continual-Leanring-Simulator
@@ -305,6 +684,12 @@ class EndlessCLSimDataset(DownloadableDataset):
             Defaults to True.
         :param semseg: boolean to indicate the use of targets for a
             semantic segmentation task. Defaults to False.
+        :param use_dali: boolean to offload decode, resize and class
+            mapping of the semantic segmentation data to the GPU with
+            NVIDIA DALI. Requires `semseg` to be set and the
+            `nvidia-dali` package to be installed. When set, indexing
+            this dataset returns (train, test) DALI iterators instead of
+            the subsequence datasets. Defaults to False.
         :param labelmap_path: path (str) to a labelmap.json file,
             that provides a dictionary mapping 'class-names'(str) to
             class-labels(int). The 'class-names' are derived from the
@@ -324,8 +709,20 @@ class EndlessCLSimDataset(DownloadableDataset):
         self.transform = transform
         self.target_transform = target_transform
         self.semseg = semseg
+        self.use_dali = use_dali
         self.labelmap_path = labelmap_path
 
+        if self.use_dali:
+            if not self.semseg:
+                raise ValueError("use_dali is only supported with semseg!")
+            if dali is None:
+                raise ModuleNotFoundError(
+                    "nvidia-dali is not installed. Please install it "
+                    "following the instructions at "
+                    "https://docs.nvidia.com/deeplearning/dali/ to use "
+                    "the DALI backend."
+                )
+
         self.train_sub_sequence_datasets: List[ClassificationSubSequence] = []
         self.test_sub_sequence_datasets: List[ClassificationSubSequence] = []
 
@@ -378,31 +775,28 @@ class EndlessCLSimDataset(DownloadableDataset):
         :return: success (bool): Boolean wether the preparation was successfull.
         """
         # Get sequence dirs
-        sequence_paths = glob.glob(path + os.path.sep + "*" + os.path.sep)
+        sequence_paths = [e.path for e in os.scandir(path) if e.is_dir()]
 
         # For every sequence (train, test)
         for sequence_path in sequence_paths:
-            sub_sequence_paths = glob.glob(
-                sequence_path + os.path.sep + "*" + os.path.sep
-            )
             # Get sub-sequence dirs (0,1,....,n)
+            sub_sequence_paths = [
+                e.path for e in os.scandir(sequence_path) if e.is_dir()
+            ]
             for sub_sequence_path in sub_sequence_paths:
                 image_paths = []
                 targets = []
 
                 # Get class dirs
-                class_name_dirs = [
-                    f.name
-                    for f in os.scandir(sub_sequence_path + os.path.sep)
-                    if f.is_dir()
-                ]
+                class_dirs = [e for e in os.scandir(sub_sequence_path) if e.is_dir()]
 
                 # Load file_paths and targets
-                for class_name in class_name_dirs:
-                    class_path = sub_sequence_path + class_name + os.path.sep
-                    for file_name in os.listdir(class_path):
-                        image_paths.append(class_path + file_name)
-                        targets.append(class_name)
+                for class_dir in class_dirs:
+                    class_file_paths = [
+                        e.path for e in os.scandir(class_dir.path) if e.is_file()
+                    ]
+                    image_paths.extend(class_file_paths)
+                    targets.extend([class_dir.name] * len(class_file_paths))
 
                 # Create sub-sequence dataset
                 subsequence_dataset = ClassificationSubSequence(
@@ -442,11 +836,10 @@ class EndlessCLSimDataset(DownloadableDataset):
 
     def _load_sequence_indices(self, sequence_file):
         sequence_indices = {}
-        with open(sequence_file) as file:
-            json_array = json.load(file)
+        json_array = _load_json(sequence_file)
 
-            for i in range(len(json_array)):
-                sequence_indices[i] = json_array[i]["Sequence"]["ImageCounter"]
+        for i in range(len(json_array)):
+            sequence_indices[i] = json_array[i]["Sequence"]["ImageCounter"]
         return sequence_indices
 
     def _prepare_video_subsequence_datasets(self, path) -> bool:
@@ -456,12 +849,12 @@ class EndlessCLSimDataset(DownloadableDataset):
         :return: success (bool) Boolean wether the preparation was successfull.
         """
         # Get sequence dirs
-        sequence_paths = glob.glob(path + os.path.sep + "*" + os.path.sep)
+        sequence_paths = sorted(p for p in Path(path).iterdir() if p.is_dir())
 
         # For every sequence (train, test)
         for sequence_path in sequence_paths:
             # Get dir contents (data + files)
-            data_contents = glob.glob(sequence_path + os.path.sep + "*")
+            data_contents = sorted(sequence_path.iterdir())
 
             image_paths = []
             target_paths = []
@@ -471,37 +864,47 @@ class EndlessCLSimDataset(DownloadableDataset):
             # Get Color, Seg dirs
             for data_content in data_contents:
                 # If directory
-                if Path(data_content).is_dir():
-                    dir_name = data_content.split(os.path.sep)[-1]
-                    if "Color" == dir_name:
+                if data_content.is_dir():
+                    if "Color" == data_content.name:
                         # Extend color path
-                        color_path = data_content + os.path.sep + "0" + os.path.sep
-                        # Get all files
-                        for file_name in sorted(os.listdir(color_path)):
-                            image_paths.append(color_path + file_name)
-                    elif "Seg" == dir_name:
+                        color_path = data_content / "0"
+                        # Get all files, in natural frame order
+                        for entry in sorted(
+                            os.scandir(color_path),
+                            key=lambda e: _natural_sort_key(e.name),
+                        ):
+                            image_paths.append(entry.path)
+                    elif "Seg" == data_content.name:
                         # Extend seg path
-                        seg_path = data_content + os.path.sep + "0" + os.path.sep
-                        # Get all files
-                        for file_name in sorted(os.listdir(seg_path)):
-                            target_paths.append(seg_path + file_name)
+                        seg_path = data_content / "0"
+                        # Get all files, in natural frame order
+                        for entry in sorted(
+                            os.scandir(seg_path),
+                            key=lambda e: _natural_sort_key(e.name),
+                        ):
+                            target_paths.append(entry.path)
 
                 # If file
-                if Path(data_content).is_file():
-                    if "Sequence.json" in data_content:
-                        sequence_file = data_content
-                    elif "Segmentation.json" in data_content:
-                        segmentation_file = data_content
+                if data_content.is_file():
+                    if "Sequence.json" in data_content.name:
+                        sequence_file = str(data_content)
+                    elif "Segmentation.json" in data_content.name:
+                        segmentation_file = str(data_content)
 
             # Final checks
             if not len(image_paths) == len(target_paths):
-                print("Not equal number of images and targets!")
+                warn("Not equal number of images and targets!")
                 return False
+            # Color and Seg listings are parallel lists; a naming mismatch
+            # between them would silently mis-pair images and targets
+            assert [Path(p).name for p in image_paths] == [
+                Path(p).name for p in target_paths
+            ], "Color and Seg file names do not match!"
             if sequence_file is None:
-                print("No Sequence.json found!")
+                warn("No Sequence.json found!")
                 return False
             if segmentation_file is None:
-                print("No Segmentation.json found!")
+                warn("No Segmentation.json found!")
                 return False
 
             if self.verbose:
@@ -512,6 +915,12 @@ class EndlessCLSimDataset(DownloadableDataset):
             if self.verbose:
                 print("Sequence file loaded..")
 
+            # Parse the shared metadata once for the whole sequence; the
+            # subsequences receive the already parsed mappings instead of
+            # re-reading the same files
+            classmap = VideoSubSequence._load_classmap(None)
+            labelmap = VideoSubSequence._load_labelmap(segmentation_file)
+
             for i in range(len(sequence_indices)):
                 last_index = sequence_indices[i]
                 if (i + 1) == len(sequence_indices):
@@ -532,10 +941,12 @@ class EndlessCLSimDataset(DownloadableDataset):
                     patch_size=self.patch_size,
                     transform=self.transform,
                     target_transform=self.target_transform,
+                    classmap=classmap,
+                    labelmap=labelmap,
                 )
-                if "train" in (sequence_path.lower()):
+                if "train" in (sequence_path.name.lower()):
                     self.train_sub_sequence_datasets.append(subsequence_dataset)
-                elif "test" in (sequence_path.lower()):
+                elif "test" in (sequence_path.name.lower()):
                     self.test_sub_sequence_datasets.append(subsequence_dataset)
                 else:
                     raise ValueError(
@@ -544,13 +955,37 @@ class EndlessCLSimDataset(DownloadableDataset):
                     )
         return True
 
+    def _get_dali_iterators(self, index, batch_size=1, num_threads=2, device_id=0):
+        """Builds DALI iterators for the index-th subsequence pair.
+
+        :param index: Index of the (train, test) subsequence pair.
+        :return: tuple of `DALIGenericIterator`, yielding (image, target)
+            batches preprocessed on the GPU.
+        """
+        from nvidia.dali.plugin.pytorch import DALIGenericIterator
+
+        train_pipeline = self.train_sub_sequence_datasets[index].dali_pipeline(
+            batch_size=batch_size, num_threads=num_threads, device_id=device_id
+        )
+        test_pipeline = self.test_sub_sequence_datasets[index].dali_pipeline(
+            batch_size=batch_size, num_threads=num_threads, device_id=device_id
+        )
+        return (
+            DALIGenericIterator([train_pipeline], ["data", "label"]),
+            DALIGenericIterator([test_pipeline], ["data", "label"]),
+        )
+
     def __getitem__(self, index):
         """Index dataset.
 
         :param index: Index
         :return: tuple (TrainSubSeqquenceDataset, TestSubSequenceDataset),
             the i-th subsequence data, as requested by the provided index.
+            If `use_dali` is set, a tuple of DALI iterators over the same
+            data is returned instead.
         """
+        if self.use_dali:
+            return self._get_dali_iterators(index)
         return (
             self.train_sub_sequence_datasets[index],
             self.test_sub_sequence_datasets[index],
@@ -573,14 +1008,19 @@ class EndlessCLSimDataset(DownloadableDataset):
 
             # see all extracted files and extract all .zip again
             extract_root_file_list = glob.glob(str(extract_root) + "/*")
-            for file_name in extract_root_file_list:
+
+            def _extract_inner_archive(file_name):
                 sub_file_name = file_name.split("/")[-1]
-                extract_subsubdir = extract_subdir + "/" + sub_file_name.split(".")[0]
                 if self.verbose:
                     print(f"Extracting: {sub_file_name} to {extract_subdir}")
                 self._extract_archive(file_name, extract_subdir, remove_archive=True)
                 if self.verbose:
-                    print("Extraction complete!")
+                    print(f"Extraction of {sub_file_name} complete!")
+
+            # Extract the inner archives in parallel: zlib releases the
+            # GIL during decompression, so threads scale here
+            with ThreadPoolExecutor(max_workers=min(8, os.cpu_count())) as executor:
+                list(executor.map(_extract_inner_archive, extract_root_file_list))
 
             if self.verbose:
                 print("All extractions complete!")
@@ -663,7 +1103,6 @@ if __name__ == "__main__":
     from torch.utils.data.dataloader import DataLoader
     import matplotlib.pyplot as plt
     from torchvision import transforms
-    import torch
 
     _default_transform = transforms.Compose([transforms.ToTensor()])
 
@@ -687,12 +1126,22 @@ if __name__ == "__main__":
             = {len(subsequence)}"
     )
 
-    dataloader = DataLoader(subsequence, batch_size=1)
+    # pin_memory halves the host->device copy cost, persistent_workers
+    # keeps the workers (and their parsed metadata) alive across epochs
+    # instead of re-initializing the dataset every epoch
+    dataloader = DataLoader(
+        subsequence,
+        batch_size=16,
+        num_workers=4,
+        pin_memory=True,
+        persistent_workers=True,
+        prefetch_factor=2,
+    )
 
     for i, (img, target) in enumerate(dataloader):
         print(i)
         print(img.shape)
-        img = torch.squeeze(img)
+        img = img[0]
         img = transforms.ToPILImage()(img)
         print("img size:", img.size)
         print("targets:", np.unique(target))
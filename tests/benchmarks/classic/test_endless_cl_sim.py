@@ -14,12 +14,30 @@
 
 import unittest
 import os
+import threading
+
+import torch
+from torch.utils.data import Dataset
+from torch.utils.data.dataloader import DataLoader
 
 from avalanche.benchmarks.classic import EndlessCLSim
 from avalanche.benchmarks.datasets.dataset_utils import default_dataset_location
+from avalanche.benchmarks.datasets.endless_cl_sim.endless_cl_sim import (
+    PrefetchingSubSequence,
+)
 from tests.unit_tests_utils import FAST_TEST, is_github_action
 
 
+class _InMemoryDataset(Dataset):
+    """Minimal picklable dataset used by the prefetching tests."""
+
+    def __len__(self):
+        return 8
+
+    def __getitem__(self, index):
+        return torch.full((2, 2), float(index)), index
+
+
 class EndlessCLSimTest(unittest.TestCase):
     @unittest.skipIf(
         FAST_TEST or is_github_action(),
@@ -106,5 +124,38 @@ class EndlessCLSimTest(unittest.TestCase):
         return
 
 
+class PrefetchingSubSequenceTest(unittest.TestCase):
+    def test_workers_after_parent_access(self):
+        # Regression test: probing a sample in the parent process used to
+        # leave the forked DataLoader workers with an inherited thread
+        # pool without live threads, deadlocking the first batch.
+        dataset = PrefetchingSubSequence(_InMemoryDataset())
+
+        _, target = dataset[0]
+        self.assertEqual(0, target)
+
+        collected = []
+
+        def _consume():
+            loader = DataLoader(dataset, batch_size=1, num_workers=1)
+            for _, targets in loader:
+                collected.append(int(targets[0]))
+
+        consumer = threading.Thread(target=_consume, daemon=True)
+        consumer.start()
+        consumer.join(timeout=60)
+
+        self.assertFalse(consumer.is_alive(), "DataLoader deadlocked!")
+        self.assertEqual(list(range(8)), collected)
+
+    def test_prefetched_order(self):
+        dataset = PrefetchingSubSequence(_InMemoryDataset(), lookahead=4)
+
+        for i in range(8):
+            img, target = dataset[i]
+            self.assertEqual(i, target)
+            self.assertTrue(torch.equal(torch.full((2, 2), float(i)), img))
+
+
 if __name__ == "__main__":
     unittest.main()